@@ -4,23 +4,56 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import os
 import re
 import sys
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from html import unescape
 from html.parser import HTMLParser
 from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin, urlparse, urlunparse
 from urllib.request import Request, urlopen
 
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/122.0.0.0 Safari/537.36"
 )
 
-PAGE_PATH_RE = re.compile(r"/(?P<book>\d+)/(?P<volume>\d+)/(?P<page>\d+)/?$")
-WHITESPACE_RE = re.compile(r"\s+")
+REQUEST_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "ar,fa;q=0.9,en;q=0.5",
+}
+
+HREF_RE = re.compile(rb"<a\s[^>]*href\s*=\s*[\"']([^\"']+)[\"']", re.IGNORECASE)
+
+PREFETCH_WORKERS = 4
+
+CACHE_DIR = ".eshia_cache"
+CACHE_MAX_AGE_SECONDS = 30 * 86400
+
+# Keep-alive connection pool shared by all fetches, so a long crawl pays for
+# TCP+TLS setup once per worker instead of once per page.
+_POOL = (
+    urllib3.PoolManager(maxsize=PREFETCH_WORKERS, headers=REQUEST_HEADERS)
+    if urllib3 is not None
+    else None
+)
 
 BLOCK_END_TAGS = {
     "address",
@@ -57,6 +90,12 @@ BLOCK_END_TAGS = {
 FORCED_BREAK_TAGS = {"br", "hr"}
 MUTED_TAGS = {"script", "style", "noscript"}
 
+READER_TD_CLASS = "book-page-show"
+
+
+class _ParseDone(Exception):
+    """Raised to abort HTMLParser.feed once the reader block has closed."""
+
 
 @dataclass(frozen=True)
 class PageRef:
@@ -65,19 +104,32 @@ class PageRef:
     page: int
 
 
-def parse_page_ref(url: str) -> PageRef:
-    match = PAGE_PATH_RE.search(urlparse(url).path)
-    if not match:
-        raise ValueError(
-            "URL must end with /<book_id>/<volume>/<page>, got: " + url
-        )
-    return PageRef(
-        book_id=int(match.group("book")),
-        volume=int(match.group("volume")),
-        page=int(match.group("page")),
-    )
+def _parse_three_ints_suffix(path: str) -> tuple[int, int, int] | None:
+    """Parse a trailing /<book>/<volume>/<page> of integers without regex.
+
+    rsplit + isdecimal run as plain C string loops, which beats firing up
+    the regex engine for every candidate href.  isdecimal (not isdigit)
+    matches exactly the characters int() accepts, same as the old \\d regex.
+    """
+    parts = path.rstrip("/").rsplit("/", 3)
+    if len(parts) != 4:
+        return None
+    book, volume, page = parts[1], parts[2], parts[3]
+    if not (book.isdecimal() and volume.isdecimal() and page.isdecimal()):
+        return None
+    return int(book), int(volume), int(page)
+
 
+def parse_page_ref(url: str) -> PageRef | None:
+    """Return the page reference encoded in the URL path, or None."""
+    parsed = _parse_three_ints_suffix(urlparse(url).path)
+    if parsed is None:
+        return None
+    book_id, volume, page = parsed
+    return PageRef(book_id=book_id, volume=volume, page=page)
 
+
+@functools.lru_cache(maxsize=4096)
 def canonical_url(url: str) -> str:
     parsed = urlparse(url)
     path = parsed.path.rstrip("/")
@@ -86,24 +138,129 @@ def canonical_url(url: str) -> str:
     return urlunparse((parsed.scheme, parsed.netloc, path, "", "", ""))
 
 
-def fetch_html(url: str, timeout: float, retries: int) -> str:
+def _charset_from_content_type(content_type: str | None) -> str | None:
+    if not content_type:
+        return None
+    for part in content_type.split(";")[1:]:
+        name, _, value = part.partition("=")
+        if name.strip().lower() == "charset":
+            return value.strip().strip("\"'") or None
+    return None
+
+
+def _decode_body(raw: bytes, charset: str | None) -> str:
+    try:
+        return raw.decode(charset or "utf-8")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
+
+def _normalize_utf8(raw: bytes, charset: str | None) -> bytes:
+    """Re-encode a response body to UTF-8 unless it already is."""
+    if charset is None or charset.lower().replace("_", "-") in ("utf-8", "utf8"):
+        return raw
+    return _decode_body(raw, charset).encode("utf-8")
+
+
+class PageCache:
+    """On-disk HTML cache keyed by URL, so reruns and resumes skip the network.
+
+    Entries live as UTF-8-normalized page bytes under the cache directory,
+    named by the SHA-256 of the canonical URL, and expire by file mtime.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, refresh: bool = False) -> None:
+        self._directory = directory
+        self._refresh = refresh
+        os.makedirs(directory, exist_ok=True)
+
+    def _entry_path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, digest + ".html")
+
+    def get(self, url: str) -> bytes | None:
+        if self._refresh:
+            return None
+        path = self._entry_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > CACHE_MAX_AGE_SECONDS:
+                return None
+            with open(path, "rb") as entry:
+                return entry.read()
+        except OSError:
+            return None
+
+    def set(self, url: str, raw: bytes) -> None:
+        # Write-then-rename keeps entries atomic: a crash mid-write leaves
+        # only a stray temp file, never a truncated entry that a rerun
+        # would silently serve.
+        path = self._entry_path(url)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as entry:
+                entry.write(raw)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+def fetch_bytes(
+    url: str,
+    timeout: float,
+    retries: int,
+    cache: PageCache | None = None,
+) -> bytes:
+    """Return the page body as UTF-8 bytes, via the cache when possible.
+
+    Link discovery runs directly on these bytes; decode_html() converts them
+    to str only when the reader text is actually extracted.
+    """
+    if cache is not None:
+        key = canonical_url(url)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        raw = _fetch_bytes_network(url, timeout=timeout, retries=retries)
+        cache.set(key, raw)
+        return raw
+    return _fetch_bytes_network(url, timeout=timeout, retries=retries)
+
+
+def _fetch_bytes_network(url: str, timeout: float, retries: int) -> bytes:
+    if _POOL is not None:
+        try:
+            # total counts retries after the first attempt, so retries - 1
+            # keeps --retries meaning attempts in total, same as the urllib
+            # loop below.  status_forcelist makes transient 5xx responses
+            # retry like they do there, instead of surfacing as a response.
+            response = _POOL.request(
+                "GET",
+                url,
+                timeout=timeout,
+                retries=urllib3.Retry(
+                    total=max(retries - 1, 0),
+                    backoff_factor=0.8,
+                    status_forcelist={429, 500, 502, 503, 504},
+                    allowed_methods=["GET"],
+                ),
+            )
+        except urllib3.exceptions.HTTPError as error:
+            raise RuntimeError(f"Failed to fetch {url}: {error}") from error
+        if response.status >= 400:
+            raise RuntimeError(f"Failed to fetch {url}: HTTP {response.status}")
+        charset = _charset_from_content_type(response.headers.get("Content-Type"))
+        return _normalize_utf8(response.data, charset)
+
     last_error: Exception | None = None
     for attempt in range(1, retries + 1):
-        request = Request(
-            url,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Accept-Language": "ar,fa;q=0.9,en;q=0.5",
-            },
-        )
+        request = Request(url, headers=REQUEST_HEADERS)
         try:
             with urlopen(request, timeout=timeout) as response:
                 raw = response.read()
-                charset = response.headers.get_content_charset() or "utf-8"
-                try:
-                    return raw.decode(charset)
-                except LookupError:
-                    return raw.decode("utf-8", errors="replace")
+                return _normalize_utf8(raw, response.headers.get_content_charset())
         except (HTTPError, URLError, TimeoutError) as error:
             last_error = error
             if attempt < retries:
@@ -111,21 +268,61 @@ def fetch_html(url: str, timeout: float, retries: int) -> str:
     raise RuntimeError(f"Failed to fetch {url}: {last_error}")
 
 
-def discover_last_page_in_volume(
+def decode_html(raw: bytes) -> str:
+    return raw.decode("utf-8")
+
+
+def collect_page_refs(
     current_url: str,
-    current_ref: PageRef,
     hrefs: list[str],
-) -> int | None:
-    highest_page = current_ref.page
-    found = False
+) -> list[tuple[PageRef, str]]:
+    """Canonicalize and parse every href once, keeping only page links.
+
+    Both next-page and last-page discovery iterate the same links, so the
+    urljoin/urlparse work happens here a single time per page.
+    """
+    parsed_base = urlparse(current_url)
+    origin = f"{parsed_base.scheme}://{parsed_base.netloc}"
+    # The site serves the same pages over both schemes, so an absolute href
+    # on either one still counts as same-host.
+    same_host_prefixes = (
+        f"https://{parsed_base.netloc}/",
+        f"http://{parsed_base.netloc}/",
+    )
 
+    page_links: list[tuple[PageRef, str]] = []
     for href in hrefs:
-        joined = canonical_url(urljoin(current_url, href))
-        try:
-            candidate_ref = parse_page_ref(joined)
-        except ValueError:
+        # Most hrefs are nav/assets/external; probing the raw href skips
+        # them before paying for urljoin + canonicalization.
+        if _parse_three_ints_suffix(href) is None:
+            continue
+        # Nearly every surviving href is site-relative or absolute on the
+        # same host; string prefix checks cover those without the full
+        # urljoin parse. Other hosts are not book pages and are dropped.
+        if href.startswith(same_host_prefixes):
+            joined = href
+        elif href.startswith("/") and not href.startswith("//"):
+            joined = origin + href
+        elif href.startswith(("http://", "https://", "mailto:", "javascript:", "#")):
+            continue
+        else:
+            joined = urljoin(current_url, href)
+        joined = canonical_url(joined)
+        candidate_ref = parse_page_ref(joined)
+        if candidate_ref is None:
             continue
+        page_links.append((candidate_ref, joined))
+    return page_links
 
+
+def discover_last_page_in_volume(
+    current_ref: PageRef,
+    page_links: list[tuple[PageRef, str]],
+) -> int | None:
+    highest_page = current_ref.page
+    found = False
+
+    for candidate_ref, _ in page_links:
         if candidate_ref.book_id != current_ref.book_id:
             continue
         if candidate_ref.volume != current_ref.volume:
@@ -154,10 +351,75 @@ def print_progress_bar(processed: int, total: int, current_ref: PageRef) -> None
     print(line, end="", file=sys.stderr, flush=True)
 
 
-class EshiaPageParser(HTMLParser):
+class _ReaderTextBuilder:
+    """Accumulates reader text with whitespace/newline normalization.
+
+    Shared by the HTMLParser-based fallback and the selectolax fast path so
+    both produce byte-identical output.
+    """
+
+    def __init__(self) -> None:
+        self._pre_depth = 0
+        self._buf = bytearray()
+
+    def _append_footnote_separator(self) -> None:
+        buf = self._buf
+        while buf and buf[-1] == 0x20:
+            del buf[-1]
+        if buf and buf[-1] != 0x0A:
+            buf += b"\n"
+        buf += b"____________\n"
+
+    def _append_text(self, text: str) -> None:
+        if not text:
+            return
+
+        if self._pre_depth == 0:
+            # " ".join(split) collapses whitespace runs in one C pass; keep a
+            # single boundary space where the chunk started or ended with one.
+            collapsed = " ".join(text.split())
+            if not collapsed:
+                text = " "
+            else:
+                prefix = " " if text[0].isspace() else ""
+                suffix = " " if text[-1].isspace() else ""
+                text = prefix + collapsed + suffix
+
+        buf = self._buf
+        if not buf or buf[-1] == 0x0A or buf[-1] == 0x20:
+            text = text.lstrip(" ")
+
+        if text:
+            buf += text.encode("utf-8")
+
+    def _append_newline(self, force: bool) -> None:
+        buf = self._buf
+        if not buf:
+            return
+
+        while buf and buf[-1] == 0x20:
+            del buf[-1]
+        if not buf:
+            return
+
+        if force:
+            buf += b"\n"
+            return
+
+        if buf[-1] != 0x0A:
+            buf += b"\n"
+
+    def reader_text(self) -> str:
+        return self._buf.decode("utf-8").strip("\n")
+
+
+class EshiaPageParser(HTMLParser, _ReaderTextBuilder):
     def __init__(self) -> None:
-        super().__init__(convert_charrefs=True)
-        self.hrefs: list[str] = []
+        # convert_charrefs=False keeps HTMLParser from splitting text around
+        # every entity; only the references that land inside the reader block
+        # are decoded, in handle_entityref/handle_charref.
+        HTMLParser.__init__(self, convert_charrefs=False)
+        _ReaderTextBuilder.__init__(self)
         self.found_reader = False
         self._in_reader = False
         self._reader_td_depth = 0
@@ -166,23 +428,23 @@ class EshiaPageParser(HTMLParser):
         self._footnote_depth = 0
         self._in_footnote_section = False
         self._footnote_separator_emitted = False
-        self._pre_depth = 0
-        self._parts: list[str] = []
+        self._pending: list[str] = []
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        attr_map = {name: value or "" for name, value in attrs}
-        if tag == "a":
-            href = attr_map.get("href")
-            if href:
-                self.hrefs.append(href)
-
+        # Guards that need no attributes run first, so skipped regions and
+        # non-td tags outside the reader never pay for dict/set construction.
         if not self._in_reader:
-            if tag == "td" and self._has_class(attr_map.get("class", ""), "book-page-show"):
-                self.found_reader = True
-                self._in_reader = True
-                self._reader_td_depth = 1
+            if tag == "td":
+                for name, value in attrs:
+                    if name == "class" and value and READER_TD_CLASS in value.split():
+                        self.found_reader = True
+                        self._in_reader = True
+                        self._reader_td_depth = 1
+                        break
             return
 
+        self._flush_pending()
+
         if tag == "td":
             self._reader_td_depth += 1
 
@@ -190,10 +452,6 @@ class EshiaPageParser(HTMLParser):
             self._sticky_depth += 1
             return
 
-        if tag == "div" and self._has_class(attr_map.get("class", ""), "sticky-menue"):
-            self._sticky_depth = 1
-            return
-
         if self._muted_depth > 0:
             self._muted_depth += 1
             return
@@ -202,12 +460,38 @@ class EshiaPageParser(HTMLParser):
             self._muted_depth = 1
             return
 
-        if self._is_special_heading_tag(tag, attr_map):
+        # One scan over the attribute pairs instead of building a dict and
+        # looking the same keys back up.
+        class_value = ""
+        name_value = ""
+        href_value = ""
+        for name, value in attrs:
+            if not value:
+                continue
+            if name == "class":
+                class_value = value
+            elif name == "name":
+                name_value = value
+            elif name == "href":
+                href_value = value
+
+        # Split the class attribute once per element; every check below is a
+        # set membership test instead of a fresh str.split.
+        classes = frozenset(class_value.split())
+
+        if tag == "div" and "sticky-menue" in classes:
+            self._sticky_depth = 1
+            return
+
+        if (tag == "span" and "KalamateKhas" in classes) or (
+            tag == "p"
+            and ("KalamateKhas" in classes or "KalamateKhas2" in classes)
+        ):
             self._append_text("##")
 
         if self._footnote_depth > 0:
             self._footnote_depth += 1
-        elif self._has_class(attr_map.get("class", ""), "footnote"):
+        elif "footnote" in classes:
             self._footnote_depth = 1
             self._in_footnote_section = True
 
@@ -216,7 +500,7 @@ class EshiaPageParser(HTMLParser):
 
         if (
             tag == "a"
-            and self._is_footnote_anchor(attr_map)
+            and self._is_footnote_anchor(name_value, href_value)
             and not self._footnote_separator_emitted
         ):
             self._append_footnote_separator()
@@ -232,6 +516,8 @@ class EshiaPageParser(HTMLParser):
         if not self._in_reader:
             return
 
+        self._flush_pending()
+
         if self._sticky_depth > 0:
             self._sticky_depth -= 1
         elif self._muted_depth > 0:
@@ -254,32 +540,47 @@ class EshiaPageParser(HTMLParser):
                 self._footnote_depth = 0
                 self._in_footnote_section = False
                 self._footnote_separator_emitted = False
+                # Everything after the reader block is nav/footer noise; stop
+                # tokenizing instead of feeding it through the state machine.
+                raise _ParseDone
 
     def handle_data(self, data: str) -> None:
         if not self._in_reader or self._sticky_depth > 0 or self._muted_depth > 0:
             return
-        self._append_text(data)
+        self._pending.append(data)
 
-    @staticmethod
-    def _has_class(class_value: str, class_name: str) -> bool:
-        return class_name in class_value.split()
+    def handle_entityref(self, name: str) -> None:
+        if not self._in_reader or self._sticky_depth > 0 or self._muted_depth > 0:
+            return
+        self._pending.append(unescape(f"&{name};"))
 
-    def _is_special_heading_tag(self, tag: str, attr_map: dict[str, str]) -> bool:
-        class_value = attr_map.get("class", "")
-        if tag == "span" and self._has_class(class_value, "KalamateKhas"):
-            return True
-        if tag == "p" and self._has_class(class_value, "KalamateKhas"):
-            return True
-        if tag == "p" and self._has_class(class_value, "KalamateKhas2"):
-            return True
-        return False
+    def handle_charref(self, name: str) -> None:
+        if not self._in_reader or self._sticky_depth > 0 or self._muted_depth > 0:
+            return
+        self._pending.append(unescape(f"&#{name};"))
+
+    def handle_comment(self, data: str) -> None:
+        self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        # Merge the run of data/entity chunks since the last tag into one
+        # _append_text call, so whitespace collapsing sees the same chunks
+        # as it would with convert_charrefs=True; appending them one by one
+        # would eat entity-encoded spaces at chunk boundaries inside <pre>.
+        if self._pending:
+            self._append_text("".join(self._pending))
+            self._pending.clear()
+
+    def reader_text(self) -> str:
+        self._flush_pending()
+        return super().reader_text()
 
-    def _is_footnote_anchor(self, attr_map: dict[str, str]) -> bool:
+    def _is_footnote_anchor(self, name_attr: str, href_attr: str) -> bool:
         if not (self._footnote_depth > 0 or self._in_footnote_section):
             return False
 
-        name = attr_map.get("name", "").lower()
-        href = attr_map.get("href", "").lower()
+        name = name_attr.lower()
+        href = href_attr.lower()
 
         if "_ftn" in name:
             return True
@@ -287,70 +588,120 @@ class EshiaPageParser(HTMLParser):
             return True
         return False
 
-    def _append_footnote_separator(self) -> None:
-        if self._parts:
-            self._parts[-1] = self._parts[-1].rstrip(" ")
-            if self._parts[-1] == "":
-                self._parts.pop()
-
-        if self._parts and not self._parts[-1].endswith("\n"):
-            self._parts.append("\n")
-
-        self._parts.append("____________\n")
-
-    def _append_text(self, text: str) -> None:
-        if not text:
-            return
-
-        if self._pre_depth == 0:
-            text = WHITESPACE_RE.sub(" ", text)
-
-        if not text:
-            return
-
-        if self._parts:
-            previous = self._parts[-1]
-            if previous.endswith("\n"):
-                text = text.lstrip(" ")
-            elif previous.endswith(" "):
-                text = text.lstrip(" ")
-        else:
-            text = text.lstrip(" ")
 
-        if text:
-            self._parts.append(text)
+@dataclass(frozen=True)
+class ParsedPage:
+    found_reader: bool
+    text: str
+
+
+def extract_hrefs(raw: bytes) -> list[str]:
+    """Pull anchor targets straight out of the raw markup bytes.
+
+    Link discovery only needs hrefs, so it skips the full parser entirely,
+    runs before the page is even decoded to str, and does not depend on how
+    much of the document the parsers walk.
+    """
+    return [href.decode("utf-8", errors="replace") for href in HREF_RE.findall(raw)]
+
+
+def _parse_page_selectolax(html: str) -> ParsedPage:
+    tree = SelectolaxParser(html)
+
+    reader = tree.css_first("td.book-page-show")
+    if reader is None:
+        return ParsedPage(found_reader=False, text="")
+
+    builder = _ReaderTextBuilder()
+    in_footnote_section = False
+    separator_emitted = False
+
+    def walk(node, inside_footnote: bool) -> None:
+        nonlocal in_footnote_section, separator_emitted
+
+        child = node.child
+        while child is not None:
+            tag = child.tag
+            if tag == "-text":
+                builder._append_text(child.text_content or "")
+                child = child.next
+                continue
+            if tag in MUTED_TAGS or tag.startswith(("-", "_")):
+                child = child.next
+                continue
+
+            classes = (child.attributes.get("class") or "").split()
+            if tag == "div" and "sticky-menue" in classes:
+                child = child.next
+                continue
+
+            if (tag == "span" and "KalamateKhas" in classes) or (
+                tag == "p"
+                and ("KalamateKhas" in classes or "KalamateKhas2" in classes)
+            ):
+                builder._append_text("##")
+
+            child_in_footnote = inside_footnote
+            if "footnote" in classes:
+                child_in_footnote = True
+                in_footnote_section = True
+
+            if tag == "hr":
+                in_footnote_section = True
+
+            if (
+                tag == "a"
+                and not separator_emitted
+                and (child_in_footnote or in_footnote_section)
+            ):
+                name = (child.attributes.get("name") or "").lower()
+                href = (child.attributes.get("href") or "").lower()
+                if "_ftn" in name or "_ftn" in href:
+                    builder._append_footnote_separator()
+                    separator_emitted = True
+
+            if tag == "pre":
+                builder._pre_depth += 1
+
+            if tag in FORCED_BREAK_TAGS:
+                builder._append_newline(force=True)
+
+            walk(child, child_in_footnote)
+
+            if tag == "pre":
+                builder._pre_depth -= 1
+            if tag in BLOCK_END_TAGS:
+                builder._append_newline(force=False)
 
-    def _append_newline(self, force: bool) -> None:
-        if not self._parts:
-            return
+            child = child.next
 
-        self._parts[-1] = self._parts[-1].rstrip(" ")
-        if self._parts[-1] == "":
-            self._parts.pop()
-            if not self._parts:
-                return
+    walk(reader, False)
+    return ParsedPage(found_reader=True, text=builder.reader_text())
 
-        if force:
-            self._parts.append("\n")
-            return
 
-        if not self._parts[-1].endswith("\n"):
-            self._parts.append("\n")
+def parse_page(html: str) -> ParsedPage:
+    if SelectolaxParser is not None:
+        return _parse_page_selectolax(html)
 
-    def reader_text(self) -> str:
-        return "".join(self._parts).strip("\n")
+    parser = EshiaPageParser()
+    # Skip straight to the reader <td>; everything before it carries no text.
+    marker = html.find(READER_TD_CLASS)
+    start = html.rfind("<td", 0, marker) if marker != -1 else -1
+    try:
+        parser.feed(html if start == -1 else html[start:])
+        parser.close()
+    except _ParseDone:
+        pass
+    return ParsedPage(found_reader=parser.found_reader, text=parser.reader_text())
 
 
-def find_next_page_url(current_url: str, current_ref: PageRef, hrefs: list[str]) -> str | None:
+def find_next_page_url(
+    current_ref: PageRef,
+    page_links: list[tuple[PageRef, str]],
+) -> str | None:
     candidates: dict[tuple[int, int], str] = {}
 
-    for href in hrefs:
-        joined = canonical_url(urljoin(current_url, href))
-        try:
-            candidate_ref = parse_page_ref(joined)
-        except ValueError:
-            continue
-
+    for candidate_ref, joined in page_links:
         if candidate_ref.book_id != current_ref.book_id:
             continue
         if (candidate_ref.volume, candidate_ref.page) <= (
@@ -369,6 +720,12 @@ def find_next_page_url(current_url: str, current_ref: PageRef, hrefs: list[str])
     return candidates[min(candidates.keys())]
 
 
+def predict_page_url(current_url: str, page: int) -> str:
+    """Build a sibling page URL by swapping the trailing page number."""
+    base = current_url.rsplit("/", 1)[0]
+    return f"{base}/{page}"
+
+
 def crawl_book(
     start_url: str,
     max_pages: int,
@@ -376,81 +733,139 @@ def crawl_book(
     timeout: float,
     retries: int,
     quiet: bool,
-) -> list[tuple[PageRef, str]]:
+    cache: PageCache | None = None,
+) -> Iterator[tuple[PageRef, str]]:
+    """Yield (ref, text) per page so pages never accumulate in memory."""
     current_url = canonical_url(start_url)
     start_ref = parse_page_ref(current_url)
+    if start_ref is None:
+        raise ValueError(
+            "URL must end with /<book_id>/<volume>/<page>, got: " + start_url
+        )
+    start_volume = start_ref.volume
+    start_page = start_ref.page
     estimated_total_pages: int | None = None
+    known_volume: int | None = None
+    known_last_page: int | None = None
     visited: set[PageRef] = set()
-    pages: list[tuple[PageRef, str]] = []
-
-    for _ in range(max_pages):
-        current_ref = parse_page_ref(current_url)
-        if current_ref in visited:
-            break
-        visited.add(current_ref)
+    processed = 0
 
-        html = fetch_html(current_url, timeout=timeout, retries=retries)
-        parser = EshiaPageParser()
-        parser.feed(html)
-        parser.close()
-
-        if not parser.found_reader:
-            raise RuntimeError(f"Reader element not found in: {current_url}")
+    executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+    prefetched: dict[str, Future[bytes]] = {}
 
-        pages.append((current_ref, parser.reader_text()))
-        discovered_last_page = discover_last_page_in_volume(
-            current_url=current_url,
-            current_ref=current_ref,
-            hrefs=parser.hrefs,
-        )
-        if (
-            discovered_last_page is not None
-            and current_ref.volume == start_ref.volume
-            and discovered_last_page >= start_ref.page
-        ):
-            estimated_total_pages = discovered_last_page - start_ref.page + 1
-
-        if estimated_total_pages is not None and len(pages) > estimated_total_pages:
-            estimated_total_pages = None
-
-        if not quiet:
-            display_total = max_pages
-            if estimated_total_pages is not None:
-                display_total = min(display_total, estimated_total_pages)
-            print_progress_bar(
-                processed=len(pages),
-                total=display_total,
+    try:
+        current_ref = start_ref
+        for _ in range(max_pages):
+            if current_ref in visited:
+                break
+            visited.add(current_ref)
+
+            pending = prefetched.pop(current_url, None)
+            if pending is not None:
+                raw = pending.result()
+            else:
+                raw = fetch_bytes(
+                    current_url, timeout=timeout, retries=retries, cache=cache
+                )
+
+            # Keep a sliding window of speculative fetches for the next few
+            # page numbers in flight while this page is parsed. Guesses are
+            # verified against the links discovered below; a miss is evicted
+            # and the real URL fetched on its own iteration. Once the
+            # volume's last page is known, the window stops at it instead of
+            # requesting pages past the end of the volume.
+            window_end = current_ref.page + PREFETCH_WORKERS
+            if known_volume == current_ref.volume and known_last_page is not None:
+                window_end = min(window_end, known_last_page)
+            wanted = [
+                predict_page_url(current_url, page)
+                for page in range(current_ref.page + 1, window_end + 1)
+            ]
+            for url in list(prefetched):
+                if url not in wanted:
+                    prefetched.pop(url).cancel()
+            for url in wanted:
+                if url in prefetched:
+                    continue
+                if delay_seconds > 0:
+                    time.sleep(delay_seconds)
+                prefetched[url] = executor.submit(
+                    fetch_bytes, url, timeout, retries, cache
+                )
+
+            page_links = collect_page_refs(current_url, extract_hrefs(raw))
+            parsed = parse_page(decode_html(raw))
+
+            if not parsed.found_reader:
+                raise RuntimeError(f"Reader element not found in: {current_url}")
+
+            processed += 1
+            yield current_ref, parsed.text
+
+            discovered_last_page = discover_last_page_in_volume(
                 current_ref=current_ref,
+                page_links=page_links,
             )
-
-        next_url = find_next_page_url(current_url, current_ref, parser.hrefs)
-        if not next_url:
-            break
-
-        next_ref = parse_page_ref(next_url)
-        if next_ref in visited:
-            break
-
-        current_url = next_url
-        if delay_seconds > 0:
-            time.sleep(delay_seconds)
+            if discovered_last_page is not None:
+                known_volume = current_ref.volume
+                known_last_page = discovered_last_page
+            if (
+                discovered_last_page is not None
+                and current_ref.volume == start_volume
+                and discovered_last_page >= start_page
+            ):
+                estimated_total_pages = discovered_last_page - start_page + 1
+
+            if estimated_total_pages is not None and processed > estimated_total_pages:
+                estimated_total_pages = None
+
+            if not quiet:
+                display_total = max_pages
+                if estimated_total_pages is not None:
+                    display_total = min(display_total, estimated_total_pages)
+                print_progress_bar(
+                    processed=processed,
+                    total=display_total,
+                    current_ref=current_ref,
+                )
+
+            next_url = find_next_page_url(current_ref, page_links)
+            if not next_url:
+                break
+
+            next_ref = parse_page_ref(next_url)
+            if next_ref in visited:
+                break
+
+            # The ref was just parsed from next_url; reuse it next iteration
+            # instead of re-parsing at the loop top.
+            current_url = next_url
+            current_ref = next_ref
+    finally:
+        for future in prefetched.values():
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
 
     if not quiet:
         print(file=sys.stderr)
 
-    if len(pages) >= max_pages and not quiet:
+    if processed >= max_pages and not quiet:
         print(
             f"Stopped at --max-pages ({max_pages}).",
             file=sys.stderr,
         )
 
-    return pages
 
-
-def write_output(output_path: str, pages: list[tuple[PageRef, str]]) -> None:
-    merged = "\nPAGE_SEPARATOR\n".join(text for _, text in pages)
+def write_output(output_path: str, pages: Iterable[tuple[PageRef, str]]) -> int:
+    """Stream pages to disk as they arrive; returns the page count."""
+    page_count = 0
     with open(output_path, "w", encoding="utf-8", newline="\n") as output_file:
-        output_file.write(merged)
+        for _, text in pages:
+            if page_count:
+                output_file.write("\nPAGE_SEPARATOR\n")
+            output_file.write(text)
+            page_count += 1
+    return page_count
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -496,6 +911,16 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable progress logs on stderr.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Disable the on-disk page cache (default: {CACHE_DIR}).",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Refetch every page and overwrite existing cache entries.",
+    )
     return parser
 
 
@@ -515,12 +940,16 @@ def main() -> int:
         print("--delay must be >= 0", file=sys.stderr)
         return 2
 
-    try:
-        parse_page_ref(args.start_url)
-    except ValueError as error:
-        print(str(error), file=sys.stderr)
+    if parse_page_ref(args.start_url) is None:
+        print(
+            "URL must end with /<book_id>/<volume>/<page>, got: "
+            + args.start_url,
+            file=sys.stderr,
+        )
         return 2
 
+    cache = None if args.no_cache else PageCache(refresh=args.refresh_cache)
+
     try:
         pages = crawl_book(
             start_url=args.start_url,
@@ -529,13 +958,14 @@ def main() -> int:
             timeout=args.timeout,
             retries=args.retries,
             quiet=args.quiet,
+            cache=cache,
         )
-        write_output(args.output, pages)
+        page_count = write_output(args.output, pages)
     except Exception as error:
         print(f"Error: {error}", file=sys.stderr)
         return 1
 
-    print(f"Done. Pages extracted: {len(pages)}")
+    print(f"Done. Pages extracted: {page_count}")
     print(f"Output file: {args.output}")
     return 0
 